@@ -121,6 +121,21 @@ STATICFILES_DIRS = [
     BASE_DIR / 'static',
 ]
 
+# Seconds between background recounts of denormalized counters, 0 disables them.
+
+COUNTERS_RECONCILE_INTERVAL = config('COUNTERS_RECONCILE_INTERVAL', default=60 * 60, cast=int)
+
+# Shared directory for relaying live events between worker processes.
+# Leave empty to keep events within a single process.
+
+EVENTS_IPC_DIR = config('EVENTS_IPC_DIR', default='')
+
+# User-uploaded files (avatars)
+# https://docs.djangoproject.com/en/5.2/topics/files/
+
+MEDIA_URL = 'media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
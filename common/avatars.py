@@ -0,0 +1,157 @@
+import hashlib
+import logging
+import queue
+import threading
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+AVATAR_DIRECTORY = "avatars"
+AVATAR_SIZES = (48, 96, 192)
+AVATAR_FORMATS = {
+    "webp": {"extension": "webp", "quality": 80},
+    "jpeg": {"extension": "jpg", "quality": 85, "optimize": True, "progressive": True},
+}
+AVATAR_MAX_UPLOAD_SIZE = 5 * 1024 * 1024
+AVATAR_MAX_PIXELS = 4096 * 4096
+
+logger = logging.getLogger(__name__)
+
+_jobs = queue.Queue()
+_pending_digests = set()
+_ready_digests = set()
+_lock = threading.Lock()
+_worker = None
+
+
+def get_original_name(digest: str) -> str:
+    return f"{AVATAR_DIRECTORY}/{digest[:2]}/{digest}/original"
+
+
+def get_ready_marker_name(digest: str) -> str:
+    return f"{AVATAR_DIRECTORY}/{digest[:2]}/{digest}/ready"
+
+
+def get_variant_name(digest: str, size: int, image_format: str) -> str:
+    extension = AVATAR_FORMATS[image_format]["extension"]
+    return f"{AVATAR_DIRECTORY}/{digest[:2]}/{digest}/{size}.{extension}"
+
+
+def is_avatar_ready(digest: str) -> bool:
+    if digest in _ready_digests:
+        return True
+
+    # The marker is written only after every variant is fully saved.
+    if default_storage.exists(get_ready_marker_name(digest)):
+        _ready_digests.add(digest)
+        return True
+
+    return False
+
+
+def get_avatar_srcsets(digest: str) -> dict[str, str]:
+    return {
+        image_format: ", ".join(
+            f"{default_storage.url(get_variant_name(digest, size, image_format))} {size}w"
+            for size in AVATAR_SIZES
+        )
+        for image_format in AVATAR_FORMATS
+    }
+
+
+def save_avatar_upload(uploaded_file) -> str:
+    """Store an uploaded avatar under its content hash and queue its thumbnails.
+
+    Raises ValueError if the file is too large or is not a readable image.
+    """
+    if uploaded_file.size > AVATAR_MAX_UPLOAD_SIZE:
+        raise ValueError(f"Avatar must be smaller than {AVATAR_MAX_UPLOAD_SIZE // (1024 * 1024)} MB.")
+
+    content = uploaded_file.read()
+
+    try:
+        with Image.open(BytesIO(content)) as image:
+            if image.width * image.height > AVATAR_MAX_PIXELS:
+                raise ValueError("Avatar resolution is too large.")
+            image.verify()
+    except (UnidentifiedImageError, OSError, SyntaxError, Image.DecompressionBombError):
+        # verify() reports corrupted data such as bad chunk checksums as SyntaxError.
+        raise ValueError("Uploaded file is not a valid image.")
+
+    digest = hashlib.sha256(content).hexdigest()
+
+    original_name = get_original_name(digest)
+    if not default_storage.exists(original_name):
+        default_storage.save(original_name, ContentFile(content))
+
+    if not is_avatar_ready(digest):
+        enqueue_avatar_variants(digest)
+
+    return digest
+
+
+def enqueue_avatar_variants(digest: str) -> None:
+    global _worker
+
+    with _lock:
+        if digest in _pending_digests:
+            return
+
+        _pending_digests.add(digest)
+
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_process_jobs, name="avatar-variants", daemon=True)
+            _worker.start()
+
+    _jobs.put(digest)
+
+
+def generate_avatar_variants(digest: str) -> None:
+    with default_storage.open(get_original_name(digest), "rb") as original_file:
+        with Image.open(original_file) as image:
+            image = _flatten_image(ImageOps.exif_transpose(image))
+
+            for size in AVATAR_SIZES:
+                thumbnail = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+
+                for image_format, options in AVATAR_FORMATS.items():
+                    buffer = BytesIO()
+                    save_options = {key: value for key, value in options.items() if key != "extension"}
+                    thumbnail.save(buffer, format=image_format.upper(), **save_options)
+
+                    # Leftovers of an interrupted run may be partial, and save() would not overwrite them.
+                    variant_name = get_variant_name(digest, size, image_format)
+                    default_storage.delete(variant_name)
+                    default_storage.save(variant_name, ContentFile(buffer.getvalue()))
+
+    default_storage.save(get_ready_marker_name(digest), ContentFile(b""))
+    _ready_digests.add(digest)
+
+
+def _flatten_image(image: Image.Image) -> Image.Image:
+    """Convert to RGB, placing transparent images on a white background instead of black."""
+    has_transparency = image.mode in ("RGBA", "LA") or "transparency" in image.info
+    if not has_transparency:
+        return image.convert("RGB")
+
+    image = image.convert("RGBA")
+    background = Image.new("RGBA", image.size, (255, 255, 255, 255))
+
+    return Image.alpha_composite(background, image).convert("RGB")
+
+
+def _process_jobs() -> None:
+    while True:
+        digest = _jobs.get()
+
+        try:
+            generate_avatar_variants(digest)
+        except Exception:
+            # A broken original must not kill the worker; the avatar keeps using its fallback.
+            logger.exception("Failed to generate avatar variants for %s", digest)
+        finally:
+            with _lock:
+                _pending_digests.discard(digest)
+            _jobs.task_done()
@@ -0,0 +1,168 @@
+import bisect
+import itertools
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import date
+from typing import Any
+
+from django.conf import settings
+
+from common.mixins import MOCK_ANSWERS, MOCK_QUESTIONS, MOCK_USERS
+
+logger = logging.getLogger(__name__)
+
+# Every write to the mock store goes through this lock, so a question or answer
+# and the counters derived from it always change together.
+_lock = threading.Lock()
+
+_question_ids = itertools.count(max(MOCK_QUESTIONS, default=0) + 1)
+_answer_ids = itertools.count(max(MOCK_ANSWERS, default=0) + 1)
+
+# Ascending answer ids per question, so a page of answers is found without scanning the whole store.
+_answer_ids_by_question: dict[int, list[int]] = {}
+for _answer_id in sorted(MOCK_ANSWERS):
+    _answer_ids_by_question.setdefault(MOCK_ANSWERS[_answer_id]["question_id"], []).append(_answer_id)
+
+_reconciliation_thread = None
+
+
+def _adjust_user_counter(user_id: int, field: str, delta: int) -> None:
+    user = MOCK_USERS.get(user_id)
+    if user is not None:
+        user[field] += delta
+
+
+def create_question(author_id: int, title: str, content: str, tags: set[str]) -> dict[str, Any]:
+    _start_periodic_reconciliation()
+    today = date.today()
+
+    with _lock:
+        question_id = next(_question_ids)
+        question = {
+            "id": question_id,
+            "author_id": author_id,
+            "rating": 0,
+            "title": title,
+            "content": content,
+            "tags": tags,
+            "answer_amount": 0,
+            "creation_date": f"{today.day}-{today.month}-{today.year}",
+            "is_hot": 0,
+        }
+
+        MOCK_QUESTIONS[question_id] = question
+        _answer_ids_by_question[question_id] = []
+        _adjust_user_counter(author_id, "total_questions_asked", 1)
+
+    return question
+
+
+def create_answer(question_id: int, author_id: int, content: str) -> dict[str, Any]:
+    _start_periodic_reconciliation()
+
+    with _lock:
+        question = MOCK_QUESTIONS.get(question_id)
+        if question is None:
+            raise KeyError(f"Question with ID '{question_id}' does not exist.")
+
+        answer_id = next(_answer_ids)
+        answer = {
+            "id": answer_id,
+            "question_id": question_id,
+            "author_id": author_id,
+            "rating": 0,
+            "content": content,
+            "is_correct": False,
+        }
+
+        MOCK_ANSWERS[answer_id] = answer
+        _answer_ids_by_question.setdefault(question_id, []).append(answer_id)
+        question["answer_amount"] += 1
+        _adjust_user_counter(author_id, "total_answers_posted", 1)
+
+    return answer
+
+
+def get_question_answer_ids(question_id: int, after_id: int, offset: int, limit: int) -> list[int]:
+    """Return up to limit answer ids of the question, skipping offset ids after after_id."""
+    with _lock:
+        answer_ids = _answer_ids_by_question.get(question_id, [])
+        start = bisect.bisect_right(answer_ids, after_id) + offset
+
+        return answer_ids[start:start + limit]
+
+
+def reconcile_counters(fix: bool = True) -> list[dict[str, Any]]:
+    """Recount every denormalized counter from the store and return the drifted ones.
+
+    Each drift record holds the target ("question"/"user"), its id, the field name,
+    and the stored and actual values. With fix=True the stored values are overwritten.
+    """
+    with _lock:
+        answers_per_question = Counter(answer["question_id"] for answer in MOCK_ANSWERS.values())
+        questions_per_user = Counter(question["author_id"] for question in MOCK_QUESTIONS.values())
+        answers_per_user = Counter(answer["author_id"] for answer in MOCK_ANSWERS.values())
+
+        expected = [
+            ("question", MOCK_QUESTIONS, "answer_amount", answers_per_question),
+            ("user", MOCK_USERS, "total_questions_asked", questions_per_user),
+            ("user", MOCK_USERS, "total_answers_posted", answers_per_user),
+        ]
+
+        drift = []
+        for target, records, field, actual_counts in expected:
+            for record_id, record in records.items():
+                stored = record[field]
+                actual = actual_counts[record_id]
+
+                if stored == actual:
+                    continue
+
+                drift.append({
+                    "target": target,
+                    "id": record_id,
+                    "field": field,
+                    "stored": stored,
+                    "actual": actual,
+                })
+
+                if fix:
+                    record[field] = actual
+
+    return drift
+
+
+def _start_periodic_reconciliation() -> None:
+    """Run reconcile_counters() every COUNTERS_RECONCILE_INTERVAL seconds in a daemon thread and log any drift.
+
+    Started by the first write, so only processes that serve requests run it: until
+    something is written, the seeded counters cannot drift.
+    """
+    global _reconciliation_thread
+
+    interval = settings.COUNTERS_RECONCILE_INTERVAL
+    if interval <= 0:
+        return
+
+    with _lock:
+        if _reconciliation_thread is not None:
+            return
+
+        _reconciliation_thread = threading.Thread(
+            target=_reconcile_periodically, args=(interval,), name="counters-reconciliation", daemon=True
+        )
+        _reconciliation_thread.start()
+
+
+def _reconcile_periodically(interval: int) -> None:
+    while True:
+        time.sleep(interval)
+        drift = reconcile_counters()
+
+        for record in drift:
+            logger.warning(
+                "Fixed drifted counter %s %s %s: stored=%s actual=%s",
+                record["target"], record["id"], record["field"], record["stored"], record["actual"],
+            )
@@ -0,0 +1,178 @@
+import asyncio
+import atexit
+import json
+import logging
+import os
+import socket
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+from django.conf import settings
+
+SUBSCRIBER_QUEUE_SIZE = 32
+MAX_RELAY_MESSAGE_SIZE = 64 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+def get_question_topic(question_id: int) -> str:
+    return f"question:{question_id}"
+
+
+def format_event(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class Subscription:
+    """A bounded queue of formatted events for one connected client.
+
+    Queues live on the subscriber's event loop and are only touched from it.
+    When a slow client falls behind, its backlog is replaced with a single
+    "resync" event instead of growing without limit.
+    """
+
+    def __init__(self, topic: str, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.topic = topic
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=queue_size)
+
+    def put(self, message: str) -> None:
+        if self.queue.full():
+            while not self.queue.empty():
+                self.queue.get_nowait()
+
+            message = format_event("resync", {})
+
+        self.queue.put_nowait(message)
+
+
+class EventHub:
+    """In-process pub/sub with a subscriber set per topic."""
+
+    def __init__(self):
+        self._topics: dict[str, set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._relay = None
+        self._relay_checked = False
+
+    def subscribe(self, topic: str) -> Subscription:
+        self._ensure_relay()
+        subscription = Subscription(topic)
+
+        with self._lock:
+            self._topics.setdefault(topic, set()).add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._topics.get(subscription.topic)
+            if subscribers is None:
+                return
+
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._topics[subscription.topic]
+
+    def publish(self, topic: str, event: str, data: dict[str, Any]) -> None:
+        """Send an event to local subscribers of the topic and to the other workers.
+
+        Safe to call from sync views running outside the subscribers' event loops.
+        """
+        self._ensure_relay()
+        message = format_event(event, data)
+
+        self.deliver(topic, message)
+
+        if self._relay is not None:
+            self._relay.send(topic, message)
+
+    def deliver(self, topic: str, message: str) -> None:
+        with self._lock:
+            subscribers = list(self._topics.get(topic, ()))
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, message)
+            except RuntimeError:
+                # The subscriber's loop is already closed.
+                self.unsubscribe(subscription)
+
+    def _ensure_relay(self) -> None:
+        if self._relay_checked:
+            return
+
+        with self._lock:
+            if self._relay_checked:
+                return
+
+            self._relay_checked = True
+
+            directory = getattr(settings, "EVENTS_IPC_DIR", "")
+            if directory and hasattr(socket, "AF_UNIX"):
+                self._relay = SocketRelay(directory, self.deliver)
+
+
+class SocketRelay:
+    """Local stand-in for a message broker between worker processes.
+
+    Every worker binds a Unix datagram socket inside a shared directory and
+    forwards each published event to all the other sockets found there.
+    """
+
+    def __init__(self, directory: str, deliver: Callable[[str, str], None]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock"
+        self.deliver = deliver
+
+        self._receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._receiver.bind(str(self.path))
+
+        # Sending never blocks: if a peer's buffer is full, the event is dropped for it.
+        self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sender.setblocking(False)
+
+        atexit.register(self.close)
+        threading.Thread(target=self._listen, name="events-relay", daemon=True).start()
+
+    def send(self, topic: str, message: str) -> None:
+        payload = json.dumps({"topic": topic, "message": message}).encode()
+        if len(payload) > MAX_RELAY_MESSAGE_SIZE:
+            logger.warning("Event for %s is too large to relay", topic)
+            return
+
+        for peer in self.directory.glob("*.sock"):
+            if peer == self.path:
+                continue
+
+            try:
+                self._sender.sendto(payload, str(peer))
+            except (ConnectionRefusedError, FileNotFoundError):
+                # The worker that owned this socket is gone.
+                peer.unlink(missing_ok=True)
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        self._receiver.close()
+        self._sender.close()
+        self.path.unlink(missing_ok=True)
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                payload = self._receiver.recv(MAX_RELAY_MESSAGE_SIZE)
+            except OSError:
+                return
+
+            try:
+                envelope = json.loads(payload)
+                self.deliver(envelope["topic"], envelope["message"])
+            except (ValueError, KeyError):
+                logger.warning("Dropped malformed relay message")
+
+
+hub = EventHub()
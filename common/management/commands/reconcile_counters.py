@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from common.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount answer_amount, total_questions_asked and total_answers_posted and report drift. "
+        "The mock store lives in memory, so this only checks the data of this command's own process, "
+        "not a running server's; the server reconciles itself every COUNTERS_RECONCILE_INTERVAL seconds after its first write."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drifted counters without overwriting them.",
+        )
+
+    def handle(self, *args, **options):
+        drift = reconcile_counters(fix=not options["dry_run"])
+
+        for record in drift:
+            self.stdout.write(
+                f"{record["target"]} {record["id"]}: {record["field"]} "
+                f"stored={record["stored"]} actual={record["actual"]}"
+            )
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("All counters are consistent."))
+        elif options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"Found {len(drift)} drifted counters."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Fixed {len(drift)} drifted counters."))
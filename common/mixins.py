@@ -17,7 +17,7 @@ for i in range(1, 101):
         "title": f"[{i}] Where do I find clothes?",
         "content": f"[{i}] So I'm at a store and I can't find them, there's only soup. I went through every aisle but there was only more soup. What do I do? This question description is significantly longer than the over one so I have to add more styles to fix that. Quick brown fox jumped over the lazy dog. I don't have lorem ipsum copypasta. Remebered that br exists.",
         "tags": {f"[{i}] soup", f"[{i}] tf2"},
-        "answer_amount": i,
+        "answer_amount": 0,
         "creation_date": "5-11-2025",
         "is_hot": i % 2,
     }
@@ -48,8 +48,8 @@ for i in range(1, 101):
         "displayed_name": f"[{i}] Remembered",
         "avatar": "assets/avatar.svg" if i % 2 else "assets/better-avatar.jpeg",
         "rating": i,
-        "total_questions_asked": i,
-        "total_answers_posted": i,
+        "total_questions_asked": 0,
+        "total_answers_posted": 0,
         "disliked_questions": [i + j for j in range(5)],
     }
 
@@ -69,6 +69,14 @@ for i in range(1, 101):
         "date": "5-11-2025",
     }
 
+# Counters are denormalized; common.counters keeps them in sync after seeding.
+for question in MOCK_QUESTIONS.values():
+    MOCK_USERS[question["author_id"]]["total_questions_asked"] += 1
+
+for answer in MOCK_ANSWERS.values():
+    MOCK_QUESTIONS[answer["question_id"]]["answer_amount"] += 1
+    MOCK_USERS[answer["author_id"]]["total_answers_posted"] += 1
+
 class BaseContextViewMixin:
     page_title = None
     main_title = None
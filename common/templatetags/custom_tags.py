@@ -1,4 +1,8 @@
 from django import template
+from django.core.files.storage import default_storage
+
+from common.avatars import (AVATAR_SIZES, get_avatar_srcsets,
+                            get_variant_name, is_avatar_ready)
 
 register = template.Library()
 
@@ -22,3 +26,22 @@ def get_elided_page_range(page_obj, on_each_side):
         number=current_page_number,
         on_each_side=on_each_side
     )
+
+
+@register.inclusion_tag("snippets/avatar.html")
+def avatar(user, class_name, width):
+    context = {
+        "class_name": class_name,
+        "width": width,
+        "fallback": user["avatar"],
+        "srcsets": None,
+    }
+
+    digest = user.get("avatar_digest")
+    if digest and is_avatar_ready(digest):
+        fallback_size = min((size for size in AVATAR_SIZES if size >= width), default=AVATAR_SIZES[-1])
+
+        context["srcsets"] = get_avatar_srcsets(digest)
+        context["src"] = default_storage.url(get_variant_name(digest, fallback_size, "jpeg"))
+
+    return context
@@ -1,11 +1,13 @@
 from django.urls import path
 
 from qa.views import (HotQuestionsView, NewQuestionView,
-                      QuestionDiscussionView, TagsQuestionListingView)
+                      QuestionDiscussionView, QuestionEventsView,
+                      TagsQuestionListingView)
 
 urlpatterns = [
     path("new-question/", NewQuestionView.as_view(), name="new_question"),
     path("question/<int:id>/", QuestionDiscussionView.as_view(), name="question_discussion"),
+    path("question/<int:id>/events/", QuestionEventsView.as_view(), name="question_events"),
 
     path("hot-questions/", HotQuestionsView.as_view(), name="hot_questions"),
     path("hot-questions/<int:day_amount>/", HotQuestionsView.as_view(), name="hot_questions_period"),
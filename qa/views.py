@@ -1,19 +1,78 @@
+import asyncio
 import copy
-from typing import Any
+from typing import Any, AsyncIterator, Iterator
 
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
 from django.core.paginator import Paginator
 from django.db.models.base import Model as Model
 from django.db.models.query import QuerySet
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
 from django.http.response import HttpResponse as HttpResponse
+from django.shortcuts import redirect
+from django.template import loader
+from django.urls import reverse
+from django.views import View
 from django.views.generic import DetailView, ListView, TemplateView
 
+from common.counters import (create_answer, create_question,
+                             get_question_answer_ids)
+from common.events import Subscription, get_question_topic, hub
 from common.mixins import (MOCK_ANSWERS, MOCK_QUESTIONS, MOCK_USERS,
                            BaseContextViewMixin)
+from common.utils import safe_int_conversion
 
 DEFAULT_PAGINATION_SIZE = 10
 DEFAULT_HOT_QUESTIONS_LOOKBACK_DAYS = 3
+DEFAULT_ANSWER_CHUNK_SIZE = 20
+EVENTS_HEARTBEAT_INTERVAL = 15
+EVENTS_RETRY_INTERVAL_MS = 5000
 TAG_DELIMITER = "~"
+ANSWERS_STREAM_MARKER = "<!-- answers-stream -->"
+
+
+def iter_answer_chunks(question_id: int, start: int, stop: int, chunk_size: int) -> Iterator[list[dict[str, Any]]]:
+    """Yield the question's answers in [start, stop) as lists of at most chunk_size answers.
+
+    Every chunk is looked up after the last seen id, the way a keyset-paginated query would be,
+    so only one chunk is held in memory at a time.
+    """
+    last_id = 0
+    offset = start
+    remaining = stop - start
+
+    while remaining > 0:
+        answer_ids = get_question_answer_ids(question_id, last_id, offset, min(chunk_size, remaining))
+        chunk = [
+            copy.deepcopy(MOCK_ANSWERS[answer_id])
+            for answer_id in answer_ids if answer_id in MOCK_ANSWERS
+        ]
+
+        if not chunk:
+            return
+
+        for answer in chunk:
+            answer["author"] = MOCK_USERS.get(answer["author_id"])
+
+        yield chunk
+
+        last_id = chunk[-1]["id"]
+        offset = 0
+        remaining -= len(chunk)
+
+
+def publish_answer(answer: dict[str, Any]) -> None:
+    question = MOCK_QUESTIONS.get(answer["question_id"])
+    answer = {**answer, "author": MOCK_USERS.get(answer["author_id"])}
+
+    # Rendered without a viewer, so per-user controls like "Mark as correct" are left out.
+    html = loader.render_to_string("snippets/answer-card.html", {
+        "answer": answer,
+        "question": question,
+        "is_first_chunk": False,
+    })
+
+    hub.publish(get_question_topic(answer["question_id"]), "answer", {"id": answer["id"], "html": html})
 
 class HomepageView(BaseContextViewMixin, ListView):
     template_name = "index.html"
@@ -50,6 +109,26 @@ class QuestionDiscussionView(BaseContextViewMixin, DetailView):
     template_name = "question-discussion.html"
     context_object_name = "question"
 
+    stream_answers = False
+    answer_chunk_size = DEFAULT_ANSWER_CHUNK_SIZE
+
+    def get(self, request, *args, **kwargs):
+        self.stream_answers = self.stream_answers or bool(safe_int_conversion(request.GET.get("stream")))
+        return super().get(request, *args, **kwargs)
+
+    def post(self, request, *args, **kwargs):
+        if self.current_user is None:
+            return redirect("error_401")
+
+        question = self.get_object()
+        content = request.POST.get("user_answer_content", "").strip()
+
+        if content:
+            answer = create_answer(question["id"], self.current_user["id"], content)
+            publish_answer(answer)
+
+        return redirect(request.get_full_path())
+
     def get_queryset(self):
         return MOCK_QUESTIONS
 
@@ -71,6 +150,17 @@ class QuestionDiscussionView(BaseContextViewMixin, DetailView):
         question = context["question"]
 
         context["page_title"] = f"Question | {question["title"]}"
+        page_size = self.items_per_page or DEFAULT_PAGINATION_SIZE
+        page_number = self.request.GET.get("page")
+
+        if self.stream_answers:
+            # Only the bounds of the page are needed here, answers are fetched while streaming.
+            paginator = Paginator(range(question["answer_amount"]), page_size)
+            context["page_obj"] = paginator.get_page(page_number)
+            context["paginator"] = paginator
+            context["answers_stream_marker"] = ANSWERS_STREAM_MARKER
+
+            return context
 
         found_answers = [
             copy.deepcopy(answer) for answer in MOCK_ANSWERS.values() if answer["question_id"] == question["id"]
@@ -79,9 +169,7 @@ class QuestionDiscussionView(BaseContextViewMixin, DetailView):
         for answer in found_answers:
             answer["author"] = MOCK_USERS.get(answer["author_id"])
 
-        paginator = Paginator(found_answers, self.items_per_page or DEFAULT_PAGINATION_SIZE)
-
-        page_number = self.request.GET.get("page")
+        paginator = Paginator(found_answers, page_size)
         answer_page_object = paginator.get_page(page_number)
 
         context["page_obj"] = answer_page_object
@@ -90,6 +178,78 @@ class QuestionDiscussionView(BaseContextViewMixin, DetailView):
 
         return context
 
+    def render_to_response(self, context: dict[str, Any], **response_kwargs: Any) -> HttpResponse:
+        if not self.stream_answers:
+            return super().render_to_response(context, **response_kwargs)
+
+        page_parts = self.iter_page_parts(context)
+        if isinstance(self.request, ASGIRequest):
+            page_parts = self.aiter_page_parts(page_parts)
+
+        return StreamingHttpResponse(page_parts, content_type="text/html; charset=utf-8")
+
+    async def aiter_page_parts(self, page_parts: Iterator[str]) -> AsyncIterator[str]:
+        # ASGI would buffer a sync iterator whole, so every part is rendered in a worker thread instead.
+        next_part = sync_to_async(next)
+
+        while (part := await next_part(page_parts, None)) is not None:
+            yield part
+
+    def iter_page_parts(self, context: dict[str, Any]) -> Iterator[str]:
+        page = loader.select_template(self.get_template_names()).render(context, self.request)
+        page_head, page_tail = page.split(ANSWERS_STREAM_MARKER, 1)
+
+        yield page_head
+
+        answer_list_template = loader.get_template("snippets/answer-list.html")
+        answer_range = context["page_obj"].object_list
+        answer_chunks = iter_answer_chunks(
+            context["question"]["id"], answer_range.start, answer_range.stop, self.answer_chunk_size
+        )
+
+        for chunk_index, chunk in enumerate(answer_chunks):
+            chunk_context = {**context, "answers": chunk, "is_first_chunk": chunk_index == 0}
+            yield answer_list_template.render(chunk_context, self.request)
+
+        yield page_tail
+
+
+class QuestionEventsView(View):
+    """Server-sent events with new answers to one question.
+
+    Needs an ASGI server; under WSGI it answers 204 so EventSource stops reconnecting.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        question_id = kwargs.get("id")
+
+        if question_id not in MOCK_QUESTIONS:
+            raise Http404(f"Question with ID '{question_id}' does not exist.")
+
+        if not isinstance(request, ASGIRequest):
+            return HttpResponse(status=204)
+
+        subscription = hub.subscribe(get_question_topic(question_id))
+
+        response = StreamingHttpResponse(self.iter_events(subscription), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+
+        return response
+
+    async def iter_events(self, subscription: Subscription) -> AsyncIterator[str]:
+        try:
+            yield f"retry: {EVENTS_RETRY_INTERVAL_MS}\n\n"
+
+            while True:
+                try:
+                    yield await asyncio.wait_for(subscription.queue.get(), EVENTS_HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    # Comments keep proxies from closing an idle connection.
+                    yield ": heartbeat\n\n"
+        finally:
+            hub.unsubscribe(subscription)
+
 
 class HotQuestionsView(BaseContextViewMixin, ListView):
     template_name = "question-listing.html"
@@ -192,3 +352,19 @@ class NewQuestionView(BaseContextViewMixin, TemplateView):
     template_name = "new-question.html"
     page_title = "New Question"
     main_title = "New Question"
+
+    def post(self, request, *args, **kwargs):
+        if self.current_user is None:
+            return redirect("error_401")
+
+        title = request.POST.get("title", "").strip()
+        content = request.POST.get("body", "").strip()
+        tags = {tag.strip() for tag in request.POST.get("tags", "").split(",") if tag.strip()}
+
+        if not title or not content:
+            return redirect(request.get_full_path())
+
+        question = create_question(self.current_user["id"], title, content, tags)
+
+        query = request.GET.urlencode()
+        return redirect(reverse("question_discussion", args=[question["id"]]) + (f"?{query}" if query else ""))
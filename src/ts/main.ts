@@ -4,6 +4,11 @@ const THEME_STORAGE_KEY = "user-theme";
 const LIGHT_ICON_PATH: string = "/static/assets/light-theme.svg";
 const DARK_ICON_PATH: string = "/static/assets/dark-theme.svg";
 
+interface AnswerEventData {
+    id: number;
+    html: string;
+}
+
 
 function checkActiveTab(): void {
     let currentPath = window.location.pathname;
@@ -88,6 +93,34 @@ function updateFile(event: Event): void {
     fileNameDisplay.textContent = file ? file.name : "No file selected";
 }
 
+
+function initLiveAnswers(): void {
+    const answersSection = document.querySelector(".js-answers");
+    if (!answersSection || typeof EventSource === "undefined") {
+        return;
+    }
+
+    const isLastPage = answersSection.getAttribute("data-is-last-page") === "true";
+    const source = new EventSource(answersSection.getAttribute("data-events-url"));
+
+    source.addEventListener("answer", function (event: MessageEvent): void {
+        const data: AnswerEventData = JSON.parse(event.data);
+
+        // New answers belong at the end of the list, so earlier pages leave them to the paginator.
+        if (!isLastPage || answersSection.querySelector(`[data-answer-id="${data.id}"]`)) {
+            return;
+        }
+
+        answersSection.insertAdjacentHTML("beforeend", data.html);
+    });
+
+    // Sent when this page fell too far behind to apply the missed updates one by one.
+    source.addEventListener("resync", function (): void {
+        window.location.reload();
+    });
+}
+
 document.addEventListener("DOMContentLoaded", checkActiveTab);
 document.addEventListener("DOMContentLoaded", initTheme);
 document.addEventListener("DOMContentLoaded", initCustomFileInput);
+document.addEventListener("DOMContentLoaded", initLiveAnswers);
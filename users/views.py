@@ -5,6 +5,7 @@ from django.http.response import HttpResponse as HttpResponse
 from django.shortcuts import redirect
 from django.views.generic import TemplateView
 
+from common.avatars import save_avatar_upload
 from common.mixins import MOCK_USERS, BaseContextViewMixin
 from common.utils import get_recent_activities
 
@@ -51,3 +52,18 @@ class SettingsView(BaseContextViewMixin, TemplateView):
             return redirect("error_401")
 
         return super().get(request, *args, **kwargs)
+
+    def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        if self.current_user is None:
+            return redirect("error_401")
+
+        avatar = request.FILES.get("avatar")
+        if avatar is not None:
+            try:
+                self.current_user["avatar_digest"] = save_avatar_upload(avatar)
+            except ValueError as error:
+                context = self.get_context_data(**kwargs)
+                context["avatar_error"] = str(error)
+                return self.render_to_response(context)
+
+        return redirect(request.get_full_path())